@@ -1,7 +1,24 @@
+import keyword
+import logging
 import os
 import sqlite3
-from threading import Lock
-from typing import Any, List, Tuple
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import Any, Iterator, List, Tuple
+
+log = logging.getLogger(__name__)
+
+# Répertoire du module, résolu une seule fois à l'import plutôt qu'à chaque
+# instanciation de Database.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Correspondance entre les types builtin de Python et les affinités SQLite.
+# Déclarer la bonne affinité permet à SQLite de stocker les entiers au format
+# varint natif plutôt qu'en texte, et accélère les comparaisons du B-tree.
+_TYPE_MAP = {str: "TEXT", int: "INTEGER", float: "REAL", bool: "INTEGER", bytes: "BLOB"}
+
+# Mots-clés des requêtes d'écriture, exécutées sous BEGIN IMMEDIATE.
+_DML_KEYWORDS = ("INSERT", "UPDATE", "DELETE")
 
 
 class Database:
@@ -10,9 +27,9 @@ class Database:
 
     Cette classe sert de couche d'abstraction pour effectuer des opérations sur
     la base de données, telles que la création de tables, l'insertion de lignes
-    et l'exécution de requêtes. Elle implémente un modèle de singleton pour
-    éviter les problèmes de parallélisme en permettant une seule instance de
-    connexion à la base de données.
+    et l'exécution de requêtes. Elle implémente un modèle de singleton par
+    fichier de base de données : instancier deux fois Database avec le même
+    chemin retourne la même instance.
 
     Il est possible d'hériter de cette classe afin d'utiliser ses méthodes tout 
     en ajoutant d'autres méthodes.
@@ -34,44 +51,249 @@ class Database:
         insert_row(table_name, data) -> Tuple[bool, int, int]: Insère une ligne dans une table.
     """
 
-    _instance = None
+    _instances: dict = {}
     _lock = Lock()
 
-    def __new__(cls):
+    def __new__(cls, db_name: str = "db.sqlite"):
         """
-        Implémente le pattern Singleton.
+        Implémente le pattern Singleton, à raison d'une instance par fichier.
+
+        Le chemin rapide est une simple lecture de dictionnaire sans prise de
+        verrou ; le verrou n'est pris qu'à la première instanciation pour un
+        fichier donné (double vérification).
 
         Retourne :
-            Une instance unique de la classe Database.
+            Une instance unique de la classe Database par fichier.
         """
+        instance = cls._instances.get(db_name)
+        if instance is not None:
+            return instance
+
         with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(Database, cls).__new__(cls)
-                cls._instance._initialized = False
+            instance = cls._instances.get(db_name)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._instances[db_name] = instance
 
-        return cls._instance
+            return instance
 
     def __init__(self, db_name: str = "db.sqlite") -> None:
         """
         Initialise la connexion à la base de données SQLite.
 
+        Chaque thread obtient sa propre connexion, créée à la demande : sous
+        WAL, les lectures de plusieurs threads s'exécutent ainsi en parallèle
+        au lieu de se partager un curseur unique.
+
         Arguments :
             db_name (str) : Nom du fichier de base de données SQLite.
         """
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        db_path = os.path.join(script_dir, db_name)
+        # L'instance est partagée (singleton par fichier) : ne pas rejouer
+        # l'initialisation ni les PRAGMAs lors des instanciations suivantes.
+        if self._initialized:
+            return
+        self._initialized = True
+
+        self._db_name = db_name
+
+        # Les bases en mémoire, les URI SQLite et les chemins absolus sont
+        # passés tels quels à sqlite3.connect ; seuls les noms relatifs sont
+        # rattachés au répertoire du module.
+        if db_name == ":memory:" or db_name.startswith("file:") or os.path.isabs(db_name):
+            self._db_path = db_name
+        else:
+            self._db_path = os.path.join(_SCRIPT_DIR, db_name)
+
+        # Connexion et curseur propres à chaque thread, créés à la première
+        # utilisation par _create_connection(). sqlite3.Connection ne supporte
+        # pas les références faibles, d'où un simple set vidé par close().
+        self._tls = local()
+        self._connections = set()
+
+        # Requêtes INSERT déjà construites, indexées par (table, colonnes).
+        # Réutiliser la même chaîne permet à sqlite3 de retrouver la requête
+        # déjà préparée dans son cache interne.
+        self._insert_sql_cache: dict = {}
+
+        # Même principe pour les requêtes CREATE TABLE, indexées par
+        # (table, définition des colonnes).
+        self._ddl_cache: dict = {}
+
+        self._create_connection()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Connexion SQLite du thread courant, créée si nécessaire.
+        """
+        connection = getattr(self._tls, "connection", None)
+        if connection is None:
+            connection = self._create_connection()
+        return connection
+
+    @property
+    def cursor(self) -> sqlite3.Cursor:
+        """
+        Curseur SQLite du thread courant, créé si nécessaire.
+        """
+        cursor = getattr(self._tls, "cursor", None)
+        if cursor is None:
+            self._create_connection()
+            cursor = self._tls.cursor
+        return cursor
+
+    @property
+    def _exec(self):
+        """
+        Méthode connection.execute du thread courant, mise en cache pour
+        épargner au chemin chaud la traversée de execute_query.
+        """
+        execute = getattr(self._tls, "execute", None)
+        if execute is None:
+            self._create_connection()
+            execute = self._tls.execute
+        return execute
+
+    @property
+    def _executemany(self):
+        """
+        Méthode connection.executemany du thread courant, mise en cache.
+        """
+        executemany = getattr(self._tls, "executemany", None)
+        if executemany is None:
+            self._create_connection()
+            executemany = self._tls.executemany
+        return executemany
+
+    @property
+    def _in_tx(self) -> bool:
+        return getattr(self._tls, "in_tx", False)
+
+    @_in_tx.setter
+    def _in_tx(self, value: bool) -> None:
+        self._tls.in_tx = value
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """
+        Ouvre la connexion du thread courant et applique les PRAGMAs.
 
-        self.connection = sqlite3.connect(db_path, check_same_thread=False)
-        self.cursor = self.connection.cursor()
+        Le journal WAL évite un fsync complet à chaque commit et permet aux
+        lectures de ne pas bloquer les écritures.
+
+        Retourne :
+            sqlite3.Connection : La connexion du thread courant.
+        """
+        # La taille de page ne peut être choisie que sur une base vierge,
+        # avant la création de la moindre table (et avant le passage en WAL,
+        # qui fige la taille de page). Sur une base existante, la modifier
+        # exigerait un VACUUM complet : on ne touche à rien.
+        is_new_db = (
+            self._db_name != ":memory:"
+            and not self._db_name.startswith("file:")
+            and (not os.path.exists(self._db_path) or os.path.getsize(self._db_path) == 0)
+        )
+
+        # isolation_level=None désactive la gestion implicite des transactions
+        # par le module sqlite3 : chaque requête est validée immédiatement,
+        # sauf à l'intérieur d'un bloc transaction().
+        # check_same_thread=False est conservé uniquement pour que close()
+        # puisse fermer les connexions de tous les threads.
+        db_path = self._db_path
+        uri = self._db_name.startswith("file:")
+        if self._db_name == ":memory:":
+            # Avec une base :memory: classique, chaque connexion — donc
+            # chaque thread — obtiendrait sa propre base vide. L'URI en
+            # cache partagé fait pointer les connexions de tous les threads
+            # vers la même base en mémoire, qui vit jusqu'à close().
+            db_path = "file::memory:?cache=shared"
+            uri = True
+
+        connection = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=256,
+            isolation_level=None,
+            uri=uri,
+        )
+
+        # sqlite3.Row permet d'accéder aux colonnes par nom (row["name"])
+        # sans construire un dict par ligne : la table nom -> index est
+        # partagée par toutes les lignes d'un même curseur.
+        connection.row_factory = sqlite3.Row
+
+        cursor = connection.cursor()
+
+        # Des pages de 8 Kio réduisent la profondeur du B-tree et le nombre
+        # de découpages de pages sur les charges d'écriture intensives.
+        if is_new_db:
+            cursor.execute("PRAGMA page_size=8192")
+            cursor.execute("PRAGMA auto_vacuum=NONE")
+
+        # Le mode WAL n'a pas de sens pour une base en mémoire.
+        if self._db_name != ":memory:":
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA mmap_size=268435456")
+
+        self._tls.connection = connection
+        self._tls.cursor = cursor
+        self._tls.execute = connection.execute
+        self._tls.executemany = connection.executemany
+        self._tls.in_tx = False
+        self._connections.add(connection)
+
+        return connection
 
     def close(self) -> None:
         """
-        Ferme la connexion à la base de données SQLite.
+        Ferme les connexions SQLite ouvertes par tous les threads.
 
         Cette méthode doit être appelée pour libérer les ressources.
+        L'instance est également retirée du cache du singleton : une nouvelle
+        instanciation de Database avec le même chemin rouvrira une connexion
+        fraîche au lieu de retourner l'instance fermée.
+        """
+        for connection in list(self._connections):
+            connection.close()
+        self._connections.clear()
+
+        cls = type(self)
+        with cls._lock:
+            if cls._instances.get(self._db_name) is self:
+                del cls._instances[self._db_name]
+
+    @contextmanager
+    def transaction(self):
         """
-        if self.connection:
-            self.connection.close()
+        Ouvre une transaction explicite autour d'un bloc d'opérations.
+
+        Toutes les requêtes exécutées dans le bloc partagent le même commit,
+        ce qui évite un fsync par requête :
+
+            with db.transaction():
+                db.insert_row(...)
+                db.insert_row(...)
+
+        La transaction est annulée si une exception est levée dans le bloc.
+        """
+        self.cursor.execute("BEGIN")
+        self._in_tx = True
+        try:
+            yield self
+            self.cursor.execute("COMMIT")
+        except BaseException:
+            # Si le ROLLBACK échoue (transaction déjà annulée par SQLite),
+            # ne pas masquer l'exception d'origine.
+            try:
+                self.cursor.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            raise
+        finally:
+            self._in_tx = False
 
     def execute_query(self, query: str, params: Tuple = None) -> Tuple[bool, int, int]:
         """
@@ -87,42 +309,125 @@ class Database:
                 - int : Nombre de lignes affectées.
                 - int : ID de la dernière ligne insérée.
         """
+        if params:
+            return self._exec_params(query, params)
+        return self._exec_noparams(query)
+
+    def _exec_params(self, query: str, params: Tuple) -> Tuple[bool, int, int]:
+        """
+        Variante de execute_query avec paramètres.
+
+        Les deux variantes _exec_params/_exec_noparams sont volontairement
+        monomorphes — mêmes types d'arguments et de retour à chaque appel —
+        ce qui les rend faciles à tracer et à inliner pour un JIT comme
+        celui de PyPy.
+        """
+        try:
+            if not self._in_tx and query.lstrip()[:6].upper() in _DML_KEYWORDS:
+                return self._exec_immediate(query, params)
+
+            cursor = self._exec(query, params)
+
+            if not self._in_tx:
+                self.connection.commit()
+            return True, cursor.rowcount, cursor.lastrowid
+
+        except sqlite3.Error as e:
+            log.error("Une erreur est survenue : %s", e)
+            return False, self.cursor.rowcount, self.cursor.lastrowid
+
+    def _exec_noparams(self, query: str) -> Tuple[bool, int, int]:
+        """
+        Variante de execute_query sans paramètres.
+        """
         try:
-            if params:
-                self.cursor.execute(query, params)
-            else:
-                self.cursor.execute(query)
+            if not self._in_tx and query.lstrip()[:6].upper() in _DML_KEYWORDS:
+                return self._exec_immediate(query, ())
+
+            cursor = self._exec(query)
 
-            self.connection.commit()
-            return True, self.cursor.rowcount, self.cursor.lastrowid
+            if not self._in_tx:
+                self.connection.commit()
+            return True, cursor.rowcount, cursor.lastrowid
 
         except sqlite3.Error as e:
-            print(f"Une erreur est survenue : {e}")
+            log.error("Une erreur est survenue : %s", e)
             return False, self.cursor.rowcount, self.cursor.lastrowid
 
-    def fetch_all(self, query: str, params: Tuple = None) -> List[Any]:
+    def _exec_immediate(self, query: str, params: Tuple) -> Tuple[bool, int, int]:
+        """
+        Exécute une requête d'écriture sous BEGIN IMMEDIATE.
+
+        Le verrou d'écriture est pris dès le début de la transaction au lieu
+        d'être promu au premier write, ce qui évite les échecs SQLITE_BUSY
+        tardifs lorsque plusieurs threads écrivent sous WAL.
+        """
+        execute = self._exec
+        execute("BEGIN IMMEDIATE")
+        try:
+            cursor = execute(query, params)
+            execute("COMMIT")
+        except sqlite3.Error:
+            # Si le ROLLBACK échoue (transaction déjà annulée par SQLite,
+            # par exemple après un INSERT OR ROLLBACK), ne pas masquer
+            # l'erreur d'origine.
+            try:
+                execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            raise
+
+        return True, cursor.rowcount, cursor.lastrowid
+
+    def fetch_all(self, query: str, params: Tuple = None, stream: bool = False) -> List[Any]:
         """
         Exécute une requête SELECT et récupère toutes les lignes résultantes.
 
         Arguments :
             query (str) : La requête SQL SELECT.
             params (tuple) : Paramètres optionnels.
+            stream (bool) : Si True, retourne l'itérateur de iter_rows() au
+                lieu de matérialiser toutes les lignes en mémoire.
 
         Retourne :
             list : Liste des résultats ou une liste vide en cas d'erreur.
         """
-        try:
-            if params:
-                self.cursor.execute(query, params)
-            else:
-                self.cursor.execute(query)
+        if stream:
+            return self.iter_rows(query, params)
 
+        try:
+            self.cursor.execute(query, params or ())
             return self.cursor.fetchall()
 
         except sqlite3.Error as e:
-            print(f"Une erreur est survenue : {e}")
+            log.error("Une erreur est survenue : %s", e)
             return []
 
+    def iter_rows(self, query: str, params: Tuple = None, chunk: int = 1000) -> Iterator[Any]:
+        """
+        Exécute une requête SELECT et itère sur les lignes par paquets.
+
+        Contrairement à fetch_all(), les lignes sont récupérées par paquets
+        de `chunk` lignes via fetchmany() : la mémoire consommée reste en
+        O(chunk) quelle que soit la taille du résultat.
+
+        Arguments :
+            query (str) : La requête SQL SELECT.
+            params (tuple) : Paramètres optionnels.
+            chunk (int) : Nombre de lignes récupérées par paquet.
+
+        Retourne :
+            Iterator : Un itérateur sur les lignes résultantes.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute(query, params or ())
+
+        while True:
+            rows = cursor.fetchmany(chunk)
+            if not rows:
+                return
+            yield from rows
+
     def fetch_one(self, query: str, params: Tuple = None) -> Tuple[Any] | None:
         """
         Exécute une requête SELECT et récupère une seule ligne.
@@ -135,15 +440,11 @@ class Database:
             tuple | None : La première ligne résultante ou None en cas d'erreur.
         """
         try:
-            if params:
-                self.cursor.execute(query, params)
-            else:
-                self.cursor.execute(query)
-
+            self.cursor.execute(query, params or ())
             return self.cursor.fetchone()
 
         except sqlite3.Error as e:
-            print(f"Une erreur est survenue : {e}")
+            log.error("Une erreur est survenue : %s", e)
             return None
 
     def create_table(self, table_name: str, columns: dict) -> Tuple[bool, int, int]:
@@ -153,14 +454,84 @@ class Database:
         Arguments :
             table_name (str) : Nom de la table.
             columns (dict) : Dictionnaire contenant les colonnes et leurs types.
+                Les types peuvent être des builtins Python (str, int, float,
+                bool, bytes), traduits vers l'affinité SQLite correspondante,
+                ou directement des types SQLite sous forme de chaîne.
 
         Retourne :
             Tuple[bool, int, int] : Indique si la création a été réussie.
         """
-        columns_str = ", ".join(f"{col} {dtype}" for col, dtype in columns.items())
-        query = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_str})"
+        key = (table_name, tuple(columns.items()))
+        query = self._ddl_cache.get(key)
+        if query is None:
+            # Boucle déroulée plutôt qu'une expression génératrice : on
+            # épargne la frame du générateur et une f-string par colonne.
+            parts: List[str] = []
+            append = parts.append
+            type_map_get = _TYPE_MAP.get
+            for col, dtype in columns.items():
+                append(col)
+                append(" ")
+                append(str(type_map_get(dtype, dtype)))
+                append(", ")
+            if parts:
+                parts.pop()  # séparateur final
+            query = "CREATE TABLE IF NOT EXISTS " + table_name + " (" + "".join(parts) + ")"
+            self._ddl_cache[key] = query
+
+        result = self.execute_query(query)
+
+        if result[0]:
+            self._build_insert_method(table_name, tuple(columns.keys()))
+
+        return result
+
+    def _build_insert_method(self, table_name: str, columns: Tuple[str, ...]) -> None:
+        """
+        Génère une méthode d'insertion spécialisée pour une table.
 
-        return self.execute_query(query)
+        Après create_table("users", {"name": str, "age": int}), l'instance
+        expose insert_users(name, age) : les colonnes sont des arguments
+        positionnels et la requête INSERT est figée dans le code généré.
+        C'est le chemin d'insertion le plus court du wrapper — ni itération
+        de dictionnaire ni construction de chaîne à chaque appel.
+        """
+        # Uniquement si tous les noms sont des identifiants Python valides
+        # et pas des mots-clés réservés (une colonne "class" est un schéma
+        # SQLite légal mais ferait échouer le def généré), et si l'attribut
+        # n'existe pas déjà (pour ne jamais masquer une vraie méthode comme
+        # insert_row).
+        names = (table_name,) + columns
+        if not all(
+            name.isidentifier() and not keyword.iskeyword(name) and name != "self"
+            for name in names
+        ):
+            return
+        if hasattr(self, f"insert_{table_name}"):
+            return
+
+        sql = (
+            f"INSERT INTO {table_name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(['?'] * len(columns))})"
+        )
+        args = ", ".join(columns)
+        source = (
+            f"def _ins(self, {args}):\n"
+            f"    cursor = self._exec({sql!r}, ({args},))\n"
+            f"    if not self._in_tx:\n"
+            f"        self.connection.commit()\n"
+            f"    return True, cursor.rowcount, cursor.lastrowid\n"
+        )
+        namespace: dict = {}
+        try:
+            exec(source, namespace)
+        except SyntaxError:
+            # Dernier filet de sécurité : certains identifiants valides
+            # restent interdits en position d'argument (__debug__ par
+            # exemple). Aucun nom de colonne ne doit pouvoir faire échouer
+            # create_table, on renonce simplement à la méthode spécialisée.
+            return
+        setattr(self, f"insert_{table_name}", namespace["_ins"].__get__(self))
 
     def insert_row(self, table_name: str, data: dict) -> Tuple[bool, int, int]:
         """
@@ -173,8 +544,102 @@ class Database:
         Retourne :
             Tuple[bool, int, int] : Indique si l'insertion a été réalisée avec succès.
         """
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?"] * len(data))
+        key = (table_name, tuple(data.keys()))
+        query = self._insert_sql_cache.get(key)
+        if query is None:
+            columns = ", ".join(data.keys())
+            placeholders = ", ".join(["?"] * len(data))
+            query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+            self._insert_sql_cache[key] = query
+
+        try:
+            cursor = self._exec(query, tuple(data.values()))
+
+            if not self._in_tx:
+                self.connection.commit()
+            return True, cursor.rowcount, cursor.lastrowid
+
+        except sqlite3.Error as e:
+            log.error("Une erreur est survenue : %s", e)
+            return False, self.cursor.rowcount, self.cursor.lastrowid
+
+    def insert_row_tuple(
+        self, table_name: str, columns: Tuple[str, ...], values: Tuple
+    ) -> Tuple[bool, int, int]:
+        """
+        Insère une ligne à partir d'un tuple de colonnes et de valeurs.
+
+        Variante de insert_row() pour les appelants qui disposent déjà de
+        leurs valeurs sous forme de tuple : elle évite la construction d'un
+        dictionnaire puis sa reconversion en tuple à chaque appel.
+
+        Arguments :
+            table_name (str) : Nom de la table.
+            columns (tuple) : Noms des colonnes, dans l'ordre des valeurs.
+            values (tuple) : Valeurs à insérer.
+
+        Retourne :
+            Tuple[bool, int, int] : Indique si l'insertion a été réalisée avec succès.
+        """
+        key = (table_name, columns)
+        query = self._insert_sql_cache.get(key)
+        if query is None:
+            query = (
+                f"INSERT INTO {table_name} ({', '.join(columns)}) "
+                f"VALUES ({', '.join(['?'] * len(columns))})"
+            )
+            self._insert_sql_cache[key] = query
+
+        try:
+            cursor = self._exec(query, values)
+
+            if not self._in_tx:
+                self.connection.commit()
+            return True, cursor.rowcount, cursor.lastrowid
+
+        except sqlite3.Error as e:
+            log.error("Une erreur est survenue : %s", e)
+            return False, self.cursor.rowcount, self.cursor.lastrowid
+
+    def insert_many(self, table_name: str, rows: List[dict]) -> Tuple[bool, int, int]:
+        """
+        Insère plusieurs lignes dans une table au sein d'une seule transaction.
+
+        La requête INSERT est préparée une seule fois et toutes les lignes sont
+        écrites en un seul commit, ce qui est bien plus rapide que d'appeler
+        insert_row() dans une boucle.
+
+        Arguments :
+            table_name (str) : Nom de la table.
+            rows (list) : Liste de dictionnaires, un par ligne à insérer.
+                Toutes les lignes doivent avoir les mêmes colonnes.
+
+        Retourne :
+            Tuple[bool, int, int] : Indique si l'insertion a été réalisée avec succès.
+        """
+        if not rows:
+            return True, 0, 0
+
+        keys = list(rows[0].keys())
+        columns = ", ".join(keys)
+        placeholders = ", ".join(["?"] * len(keys))
         query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+        params = [tuple(row[key] for key in keys) for row in rows]
+
+        try:
+            if not self._in_tx:
+                self._exec("BEGIN IMMEDIATE")
+            cursor = self._executemany(query, params)
+            if not self._in_tx:
+                self.connection.commit()
+            # executemany ne renseigne pas lastrowid : retourner 0 plutôt
+            # que None pour respecter le contrat Tuple[bool, int, int].
+            return True, cursor.rowcount, cursor.lastrowid or 0
 
-        return self.execute_query(query, tuple(data.values()))
+        except sqlite3.Error as e:
+            # Ne jamais annuler la transaction d'un bloc transaction()
+            # ouvert par l'appelant : seul le BEGIN posé ici est défait.
+            if not self._in_tx:
+                self.connection.rollback()
+            log.error("Une erreur est survenue : %s", e)
+            return False, self.cursor.rowcount, self.cursor.lastrowid
@@ -3,7 +3,7 @@ use std::sync::{Arc, Mutex};
 use pyo3::{
     exceptions::PyRuntimeError,
     prelude::*,
-    types::{PyBool, PyDict, PyFloat, PyInt, PyList, PyString, PyTuple},
+    types::{PyBool, PyBytes, PyDict, PyFloat, PyInt, PyList, PyString, PyTuple},
 };
 use rusqlite::{params_from_iter, Connection, ToSql};
 
@@ -236,9 +236,10 @@ impl Database {
 
     fn fetch_all<'py>(
         &self,
+        py: Python<'py>,
         query: &str,
         params: &Bound<'py, PyAny>,
-    ) -> PyResult<Vec<Vec<String>>> {
+    ) -> PyResult<Vec<Vec<PyObject>>> {
         // Convert Python list/tuple to Vec of PyAny
         let params: Vec<Bound<'_, PyAny>> = match params.get_type().name()?.to_str()? {
             "list" => params.downcast::<PyList>()?.iter().collect::<Vec<_>>(),
@@ -280,27 +281,40 @@ impl Database {
 
         let column_count = stmt.column_count();
 
-        let rows: Vec<Vec<String>> = stmt
+        // Each SQLite value is materialized directly as the matching Python
+        // object (int, float, str, bytes or None) instead of being formatted
+        // into a String first. This skips one allocation + one parse on the
+        // Python side for every cell of the result set.
+        let rows: Vec<Vec<PyObject>> = stmt
             .query_map(
                 params_from_iter(sql_params.iter().map(|p| p.as_ref())),
                 |row| {
-                    let mut values = Vec::new();
+                    let mut values = Vec::with_capacity(column_count);
                     for i in 0..column_count {
                         let value: rusqlite::types::Value = row.get(i)?;
                         values.push(match value {
-                            rusqlite::types::Value::Integer(i) => i.to_string(),
-                            rusqlite::types::Value::Real(f) => f.to_string(),
-                            rusqlite::types::Value::Text(ref s) => s.clone(),
-                            rusqlite::types::Value::Blob(ref b) => format!("{:?}", b),
-                            rusqlite::types::Value::Null => "NULL".to_string(),
+                            // i64 and f64 conversions cannot fail, hence the unwrap()
+                            rusqlite::types::Value::Integer(i) => {
+                                i.into_pyobject(py).unwrap().into_any().unbind()
+                            }
+                            rusqlite::types::Value::Real(f) => {
+                                f.into_pyobject(py).unwrap().into_any().unbind()
+                            }
+                            rusqlite::types::Value::Text(ref s) => {
+                                PyString::new(py, s).into_any().unbind()
+                            }
+                            rusqlite::types::Value::Blob(ref b) => {
+                                PyBytes::new(py, b).into_any().unbind()
+                            }
+                            rusqlite::types::Value::Null => py.None(),
                         });
                     }
                     Ok(values)
                 },
             )
             .map_err(|e| PyRuntimeError::new_err(format!("Query execution error: {}", e)))?
-            .collect::<Result<Vec<Vec<String>>, _>>()
-            .map_err(|e| PyRuntimeError::new_err(format!("Query execution error: {}", e)))?; // Collect Vec<Vec<String>>
+            .collect::<Result<Vec<Vec<PyObject>>, _>>()
+            .map_err(|e| PyRuntimeError::new_err(format!("Query execution error: {}", e)))?; // Collect Vec<Vec<PyObject>>
 
         Ok(rows)
     }
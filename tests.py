@@ -2,6 +2,7 @@ import unittest
 import os
 
 from rust_sqlite_wrapper import Database
+from sqlite_wrapper import Database as PyDatabase
 
 class TestRustSQLiteWrapper(unittest.TestCase):
 
@@ -75,5 +76,83 @@ class TestRustSQLiteWrapper(unittest.TestCase):
             self.db.execute_raw_query("SELECT * FROM non_existing_table", [])
 
 
+class TestPythonSqliteWrapper(unittest.TestCase):
+
+    # py -m unittest .\tests.py
+    TEST_DB_NAME = "test_py_db.sqlite"
+    TEST_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), TEST_DB_NAME)
+
+    def setUp(self):
+        """Initialize a fresh database instance before each test."""
+        self.db = PyDatabase(self.TEST_DB_NAME)
+        self.db.create_table("users", {"name": str, "age": int})
+
+    def tearDown(self):
+        """Close the database and remove its files after each test."""
+        self.db.close()
+        for suffix in ("", "-wal", "-shm"):
+            path = self.TEST_DB_PATH + suffix
+            if os.path.exists(path):
+                os.remove(path)
+
+    ##### INSERT_MANY #####
+
+    def test_insert_many(self):
+        """Test inserting several rows in one transaction."""
+        success, rowcount, lastrowid = self.db.insert_many(
+            "users",
+            [{"name": "a", "age": 1}, {"name": "b", "age": 2}],
+        )
+        self.assertTrue(success)
+        self.assertEqual(rowcount, 2)
+        self.assertIsInstance(lastrowid, int)
+        self.assertEqual(len(self.db.fetch_all("SELECT * FROM users")), 2)
+
+    def test_insert_many_error(self):
+        """Test that insert_many reports failure on a missing table."""
+        success, _, _ = self.db.insert_many("missing", [{"name": "a"}])
+        self.assertFalse(success)
+
+    def test_insert_many_empty(self):
+        """Test that insert_many accepts an empty list."""
+        self.assertEqual(self.db.insert_many("users", []), (True, 0, 0))
+
+    ##### END INSERT_MANY #####
+
+    ##### TRANSACTION #####
+
+    def test_transaction_rollback(self):
+        """Test that an exception rolls back the whole transaction."""
+        with self.assertRaises(ValueError):
+            with self.db.transaction():
+                self.db.insert_row("users", {"name": "a", "age": 1})
+                raise ValueError("boom")
+        self.assertEqual(self.db.fetch_all("SELECT * FROM users"), [])
+
+    def test_insert_many_error_keeps_transaction(self):
+        """Test that a failing insert_many does not abort an open transaction."""
+        with self.db.transaction():
+            self.db.insert_row("users", {"name": "a", "age": 1})
+            success, _, _ = self.db.insert_many("missing", [{"name": "b"}])
+            self.assertFalse(success)
+            self.db.insert_row("users", {"name": "c", "age": 2})
+        self.assertEqual(len(self.db.fetch_all("SELECT * FROM users")), 2)
+
+    ##### END TRANSACTION #####
+
+    ##### CLOSE #####
+
+    def test_close_then_reuse(self):
+        """Test that re-instantiating after close() reconnects."""
+        self.db.insert_row("users", {"name": "a", "age": 1})
+        self.db.close()
+        self.db = PyDatabase(self.TEST_DB_NAME)
+        success, _, _ = self.db.insert_row("users", {"name": "b", "age": 2})
+        self.assertTrue(success)
+        self.assertEqual(len(self.db.fetch_all("SELECT * FROM users")), 2)
+
+    ##### END CLOSE #####
+
+
 if __name__ == '__main__':
     unittest.main()